@@ -1,16 +1,52 @@
 # Import dependencies
+import asyncio
+from collections import defaultdict, OrderedDict
 from datetime import datetime, timedelta
 import discord
 from discord.ext import commands
-from matplotlib import pyplot as plt
+from matplotlib import colormaps
+from matplotlib.figure import Figure
 from matplotlib.ticker import PercentFormatter
 import numpy as np
-import os
-import re
-import tempfile
 
 # Import modules
-from .botUtilities import COLORS, POINT_RULES, CommandError, CountdownNotFound, getUsername, getContributor, getContextCountdown
+from .botUtilities import COLORS, POINT_RULES, CommandError, CountdownNotFound, downsample, saveFigure, getUsername, getContributor, getContextCountdown
+
+
+
+# The leaderboard rule columns (they only depend on POINT_RULES)
+RULE_NAMES = "\n".join([name for name, value in POINT_RULES.values()])
+RULE_POINTS = "\n".join([f"{value} points" for name, value in POINT_RULES.values()])
+
+
+
+# The maximum number of analytics results to keep cached
+CACHE_SIZE = 32
+
+
+
+def groupContributorHistory(data):
+    """
+    Group historical contributor data by contributor
+
+    Parameters
+    ----------
+    data : list
+        The rows returned by historicalContributorData
+
+    Returns
+    -------
+    dict
+        The downsampled progress and percentage series of each contributor
+    """
+
+    progress = defaultdict(list)
+    percentage = defaultdict(list)
+    for row in data:
+        progress[row["userid"]].append(row["progress"])
+        percentage[row["userid"]].append(row["percentage"])
+
+    return {x: (downsample(progress[x]), downsample(percentage[x])) for x in progress}
 
 
 
@@ -18,6 +54,79 @@ class Analytics(commands.Cog):
     def __init__(self, bot, db_connection):
         self.bot = bot
         self.db_connection = db_connection
+        self.cache = OrderedDict()
+
+
+
+    def getData(self, cur, function, countdown, *args, parse=None):
+        """
+        Get the rows returned by an analytics data function
+
+        Notes
+        -----
+        Results are cached until messages are added to or removed from the countdown
+        or the countdown's timezone is changed. Only the CACHE_SIZE most recently
+        used results are kept.
+
+        Parameters
+        ----------
+        cur : psycopg.cursor
+            The database cursor
+        function : str
+            The name of the data function
+        countdown : int
+            The countdown ID
+        args
+            Additional arguments for the data function
+        parse : function
+            Converts the rows into the value that gets cached and returned
+
+        Returns
+        -------
+        list
+            The rows returned by the data function (or the parsed rows)
+        """
+
+        # Get countdown version
+        cur.execute("CALL getCountdownVersion(%s, null, null, null);", (countdown,))
+        version = cur.fetchone()
+
+        # Use cached rows if they are up to date
+        key = (function, countdown, *args)
+        if (key in self.cache and self.cache[key][0] == version):
+            self.cache.move_to_end(key)
+            return self.cache[key][1]
+
+        # Remove rows cached for older versions of the countdown
+        for oldKey in [x for x in self.cache if x[1] == countdown and self.cache[x][0] != version]:
+            del self.cache[oldKey]
+
+        # Run data function
+        placeholders = ", ".join(["%s"] * (len(args) + 1))
+        cur.execute(f"SELECT * FROM {function}({placeholders});", (countdown, *args))
+        data = parse(cur.fetchall()) if parse else cur.fetchall()
+
+        # Cache rows, removing the least recently used ones
+        self.cache[key] = (version, data)
+        if (len(self.cache) > CACHE_SIZE):
+            self.cache.popitem(last=False)
+
+        return data
+
+
+
+    def clearCache(self, countdown):
+        """
+        Remove the cached analytics results of a countdown
+
+        Parameters
+        ----------
+        countdown : int
+            The countdown ID
+        """
+
+        for key in [x for x in self.cache if x[1] == countdown]:
+            del self.cache[key]
 
 
 
@@ -50,76 +159,72 @@ class Analytics(commands.Cog):
             if not countdown:
                 raise CountdownNotFound()
 
-            # Create temp file
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-            tmp.close()
-
             # Create embed
             embed=discord.Embed(title=":busts_in_silhouette: Countdown Contributors", color=COLORS["embed"])
 
             # Make sure the countdown has started
             if (option.lower() in ["h", "history"]):
                 # Create figure
-                fig, ax = plt.subplots()
+                fig = Figure()
+                ax = fig.subplots()
                 ax.set_xlabel("Progress")
                 ax.set_ylabel("Percentage of Contributions")
                 ax.yaxis.set_major_formatter(PercentFormatter())
 
                 # Get stats
-                cur.execute("SELECT * FROM contributorData(%s);", (countdown,))
-                contributors = [x["userid"] for x in cur.fetchall()]
-                cur.execute("SELECT * FROM historicalContributorData(%s);", (countdown,))
-                data = cur.fetchall()
+                contributors = [x["userid"] for x in self.getData(cur, "contributorData", countdown)]
+                data = self.getData(cur, "historicalContributorData", countdown, parse=groupContributorHistory)
 
                 if not data:
                     raise CommandError("The countdown doesn't have enough messages yet")
 
                 # Plot data and add legend
-                for author in contributors[:15]:
+                names = await asyncio.gather(*[getUsername(self.bot, x) for x in contributors[:15]])
+                for author, name in zip(contributors[:15], names):
                     # Top 15 contributors get included in the legend
-                    ax.plot([x["progress"] for x in data if x["userid"] == author], [x["percentage"] for x in data if x["userid"] == author], label=await getUsername(self.bot, author))
+                    ax.plot(*data[author], label=name)
                 for author in contributors[15:]:
-                    ax.plot([x["progress"] for x in data if x["userid"] == author], [x["percentage"] for x in data if x["userid"] == author])
+                    ax.plot(*data[author])
                 ax.legend(bbox_to_anchor=(1,1.025), loc="upper left")
 
                 # Save graph
-                fig.savefig(tmp.name, bbox_inches="tight", pad_inches=0.2)
-                file = discord.File(tmp.name, filename="image.png")
+                file = await saveFigure(fig)
 
                 # Add content to embed
                 embed.description = f"**Countdown Channel:** <#{countdown}>"
                 embed.set_image(url="attachment://image.png")
             elif (option == ""):
                 # Create figure
-                fig, ax = plt.subplots()
+                fig = Figure()
+                ax = fig.subplots()
 
                 # Get stats
-                cur.execute("SELECT * FROM contributorData(%s);", (countdown,))
-                data = cur.fetchall()
+                data = self.getData(cur, "contributorData", countdown)
 
                 if not data:
                     raise CommandError("The countdown doesn't have enough messages yet")
 
+                # Get top 15 contributors and combine the rest
+                contributions = [x["contributions"] for x in data[:15]]
+                labels = await asyncio.gather(*[getUsername(self.bot, x["userid"]) for x in data[:15]])
+                if (len(data) > 15):
+                    contributions.append(sum([x["contributions"] for x in data[15:]]))
+                    labels.append("Others")
+
                 # Add data to graph
-                pieData = ax.pie([x["contributions"] for x in data], autopct="%1.1f%%", startangle=90)
+                pieData = ax.pie(contributions, autopct="%1.1f%%", startangle=90)
 
                 # Add legend
-                ax.legend(pieData[0], [await getUsername(self.bot, x["userid"]) for x in
-                    data[:15]], bbox_to_anchor=(1,1.025), loc="upper left")
+                ax.legend(pieData[0], labels, bbox_to_anchor=(1,1.025), loc="upper left")
 
                 # Save graph
-                fig.savefig(tmp.name, bbox_inches="tight", pad_inches=0.2)
-                file = discord.File(tmp.name, filename="image.png")
+                file = await saveFigure(fig)
 
                 # Add content to embed
                 embed.description = f"**Countdown Channel:** <#{countdown}>"
-                ranksColumn = ""
-                usersColumn = ""
-                contributionsColumn = ""
-                for i in range(0, min(len(data), 20)):
-                    ranksColumn += f"{i+1:,}\n"
-                    contributionsColumn += f"{data[i]['contributions']:,} *({data[i]['percentage']:.1f}%)*\n"
-                    usersColumn += f"<@{data[i]['userid']}>\n"
+                ranksColumn = "\n".join([f"{i+1:,}" for i in range(min(len(data), 20))])
+                usersColumn = "\n".join([f"<@{x['userid']}>" for x in data[:20]])
+                contributionsColumn = "\n".join([f"{x['contributions']:,} *({x['percentage']:.1f}%)*" for x in data[:20]])
                 embed.add_field(name="Rank", value=ranksColumn, inline=True)
                 embed.add_field(name="User", value=usersColumn, inline=True)
                 embed.add_field(name="Contributions", value=contributionsColumn, inline=True)
@@ -128,16 +233,7 @@ class Analytics(commands.Cog):
                 raise CommandError(f"Unrecognized option: `{option}`")
 
         # Send embed
-        try:
-            await ctx.send(file=file, embed=embed)
-        except:
-            await ctx.send(embed=embed)
-
-        # Remove temp file
-        try:
-            os.remove(tmp.name)
-        except Exception as e:
-            self.bot.logger.error(f"Unable to delete temp file {tmp.name}", exc_info=e)
+        await ctx.send(file=file, embed=embed)
 
 
 
@@ -153,67 +249,63 @@ class Analytics(commands.Cog):
             if not countdown:
                 raise CountdownNotFound()
 
-            # Create temp file
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-            tmp.close()
-
             # Create embed
             embed=discord.Embed(title=":calendar: Countdown Estimated Completion Date", color=COLORS["embed"])
 
             # Get stats
             cur.execute("CALL progressStats(%s,null,null,null,null,null,null,null,null,null,null,null,null);", (countdown,))
             stats = cur.fetchone()
-            cur.execute("SELECT * FROM etaData(%s);", (countdown,))
-            data = cur.fetchall()
+            data = self.getData(cur, "etaData", countdown)
 
             if not data:
                 raise CommandError("The countdown doesn't have enough messages yet")
 
+            # Split data into columns
+            timestamps = [x["_timestamp"] for x in data]
+            etas = [x["eta"] for x in data]
+
             # Create figure
-            fig, ax = plt.subplots()
+            fig = Figure()
+            ax = fig.subplots()
             ax.set_xlabel("Time")
             fig.autofmt_xdate()
 
             # Add ETA data to graph
-            ax.plot([x["_timestamp"] for x in data], [x["eta"] for x in data], "C0", label="Estimated Completion Date")
+            ax.plot(downsample(timestamps), downsample(etas), "C0", label="Estimated Completion Date")
 
             # Add reference line graph
-            ax.plot([data[0]["_timestamp"], data[-1]["_timestamp"]], [data[0]["_timestamp"], data[-1]["_timestamp"]], "--C1", label="Current Date")
+            ax.plot([timestamps[0], timestamps[-1]], [timestamps[0], timestamps[-1]], "--C1", label="Current Date")
 
             # Add legend
             ax.legend()
 
             # Save graph
-            fig.savefig(tmp.name, bbox_inches="tight", pad_inches=0.2)
-            file = discord.File(tmp.name, filename="image.png")
+            file = await saveFigure(fig)
 
             # Calculate embed data
-            maxEta = max([x["eta"] for x in data])
-            maxDate = [x["_timestamp"] for x in data if x["eta"] == maxEta][0]
-            minEta = min([x["eta"] for x in data])
-            minDate = [x["_timestamp"] for x in data if x["eta"] == minEta][0]
+            maxIndex = max(range(len(etas)), key=etas.__getitem__)
+            maxEta = etas[maxIndex]
+            maxDate = timestamps[maxIndex]
+            minIndex = min(range(len(etas)), key=etas.__getitem__)
+            minEta = etas[minIndex]
+            minDate = timestamps[minIndex]
 
             # Add content to embed
-            embed.description = f"**Countdown Channel:** <#{countdown}>\n\n"
-            embed.description += f"**Maximum Estimate:** {maxEta.date()} (on {maxDate.date()})\n"
-            embed.description += f"**Minimum Estimate:** {minEta.date()} (on {minDate.date()})\n"
+            lines = [
+                f"**Countdown Channel:** <#{countdown}>",
+                "",
+                f"**Maximum Estimate:** {maxEta.date()} (on {maxDate.date()})",
+                f"**Minimum Estimate:** {minEta.date()} (on {minDate.date()})",
+            ]
             if stats['endage'] > timedelta(seconds=0):
-                embed.description += f"**Actual Completion Date:** {stats['endtime'].date()} ({stats['endage'].days:,} days ago)\n"
+                lines.append(f"**Actual Completion Date:** {stats['endtime'].date()} ({stats['endage'].days:,} days ago)")
             else:
-                embed.description += f"**Current Estimate:** {stats['endtime'].date()} ({(-1 * stats['endage']).days:,} days from now)\n"
+                lines.append(f"**Current Estimate:** {stats['endtime'].date()} ({(-1 * stats['endage']).days:,} days from now)")
+            embed.description = "\n".join(lines)
             embed.set_image(url="attachment://image.png")
 
         # Send embed
-        try:
-            await ctx.send(file=file, embed=embed)
-        except:
-            await ctx.send(embed=embed)
-
-        # Remove temp file
-        try:
-            os.remove(tmp.name)
-        except Exception as e:
-            self.bot.logger.error(f"Unable to delete temp file {tmp.name}", exc_info=e)
+        await ctx.send(file=file, embed=embed)
 
 
 
@@ -229,10 +321,6 @@ class Analytics(commands.Cog):
             if not countdown:
                 raise CountdownNotFound()
 
-            # Create temp file
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-            tmp.close()
-
             # Create embed
             embed=discord.Embed(title=":calendar_spiral: Countdown Heatmap", color=COLORS["embed"])
 
@@ -254,16 +342,17 @@ class Analytics(commands.Cog):
                 raise CommandError("The countdown doesn't have enough messages yet")
 
             # Create heatmap matrix
-            matrix = [[0 for i in range(24)] for j in range(7)]
+            matrix = np.zeros((7, 24), dtype=int)
             for row in data:
-                matrix[int(row["dow"])][int(row["hour"])] = row["messages"]
+                matrix[int(row["dow"]), int(row["hour"])] = row["messages"]
 
             # Define hour and weekday names
             hours = ["12 AM", "1 AM", "2 AM", "3 AM", "4 AM", "5 AM", "6 AM", "7 AM", "8 AM", "9 AM", "10 AM", "11 AM", "12 PM", "1 PM", "2 PM", "3 PM", "4 PM", "5 PM", "6 PM", "7 PM", "8 PM", "9 PM", "10 PM", "11 PM"]
             weekdays = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
 
             # Create figure
-            fig, ax = plt.subplots()
+            fig = Figure()
+            ax = fig.subplots()
             ax.set_xlabel("Hour of Day")
             ax.set_xticks([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23])
             ax.set_xticklabels(hours)
@@ -272,45 +361,37 @@ class Analytics(commands.Cog):
             ax.set_yticklabels(weekdays)
 
             # Add data to graph
-            cmap = plt.get_cmap("jet").copy()
+            cmap = colormaps["jet"].copy()
             cmap.set_bad("gray")
-            cax = ax.matshow(np.ma.masked_equal(np.array(matrix), 0), cmap=cmap, aspect="auto")
+            cax = ax.matshow(np.ma.masked_equal(matrix, 0), cmap=cmap, aspect="auto")
             fig.colorbar(cax)
 
             # Save graph
-            fig.savefig(tmp.name, bbox_inches="tight", pad_inches=0.2)
-            file = discord.File(tmp.name, filename="image.png")
+            file = await saveFigure(fig)
 
             # Get embed data
             total = np.sum(matrix)
             averageValue = total / (24*7)
-            maxValue = np.max(matrix)
-            maxWeekday = np.where(matrix == maxValue)[0][0]
-            maxHour = np.where(matrix == maxValue)[1][0]
+            maxWeekday, maxHour = np.unravel_index(np.argmax(matrix), matrix.shape)
+            maxValue = matrix[maxWeekday, maxHour]
             currentWeekday = int(stats['curdow'])
             currentHour = int(stats['curhour'])
-            currentValue = matrix[currentWeekday][currentHour]
+            currentValue = matrix[currentWeekday, currentHour]
 
             # Add content to embed
-            embed.description = f"**Countdown Channel:** <#{countdown}>\n\n"
-            if (userID): embed.description += f"**User:** <@{userID}>\n"
-            embed.description += f"**Total Contributions:** {total:,}\n"
-            embed.description += f"**Average Contributions per Zone:** {round(averageValue):,}\n"
-            embed.description += f"**Best Zone:** {hours[maxHour]} to {hours[(maxHour + 1) % 24]} on {weekdays[maxWeekday]}s - {maxValue:,} contributions\n"
-            embed.description += f"**Current Zone:** {hours[currentHour]} to {hours[(currentHour + 1) % 24]} on {weekdays[currentWeekday]}s - {currentValue:,} contributions\n"
+            lines = [f"**Countdown Channel:** <#{countdown}>", ""]
+            if (userID): lines.append(f"**User:** <@{userID}>")
+            lines += [
+                f"**Total Contributions:** {total:,}",
+                f"**Average Contributions per Zone:** {round(averageValue):,}",
+                f"**Best Zone:** {hours[maxHour]} to {hours[(maxHour + 1) % 24]} on {weekdays[maxWeekday]}s - {maxValue:,} contributions",
+                f"**Current Zone:** {hours[currentHour]} to {hours[(currentHour + 1) % 24]} on {weekdays[currentWeekday]}s - {currentValue:,} contributions",
+            ]
+            embed.description = "\n".join(lines)
             embed.set_image(url="attachment://image.png")
 
         # Send embed
-        try:
-            await ctx.send(file=file, embed=embed)
-        except:
-            await ctx.send(embed=embed)
-
-        # Remove temp file
-        try:
-            os.remove(tmp.name)
-        except Exception as e:
-            self.bot.logger.error(f"Unable to delete temp file {tmp.name}", exc_info=e)
+        await ctx.send(file=file, embed=embed)
 
 
 
@@ -335,10 +416,11 @@ class Analytics(commands.Cog):
             else:
                 userID = await getContributor(self.bot, countdown, user)
 
-            # Get leaderboard
-            cur.execute("SELECT * FROM leaderboardData(%s, %s);",
-                (countdown, userID))
-            data = cur.fetchall()
+            # Get leaderboard (the full leaderboard is cached, so a user's row is
+            # picked out of it instead of being queried separately)
+            data = self.getData(cur, "leaderboardData", countdown, None)
+            if (userID):
+                data = [x for x in data if x["userid"] == userID]
 
             if not data:
                 raise CommandError("The countdown doesn't have enough messages yet")
@@ -348,46 +430,37 @@ class Analytics(commands.Cog):
                 embed.description = f"**Countdown Channel:** <#{countdown}>"
 
                 # Add leaderboard
-                ranks = ""
-                points = ""
-                users = ""
-                for row in data[:20]:
-                    ranks += f"{row['ranking']:,}\n"
-                    points += f"{row['total']:,}\n"
-                    users += f"<@{row['userid']}>\n"
+                ranks = "\n".join([f"{row['ranking']:,}" for row in data[:20]])
+                points = "\n".join([f"{row['total']:,}" for row in data[:20]])
+                users = "\n".join([f"<@{row['userid']}>" for row in data[:20]])
                 embed.add_field(name="Rank",value=ranks, inline=True)
                 embed.add_field(name="Points",value=points, inline=True)
                 embed.add_field(name="User",value=users, inline=True)
 
                 # Add leaderboard rules
-                rules = ""
-                values = ""
-                for rule in POINT_RULES:
-                    rules += f"{POINT_RULES[rule][0]}\n"
-                    values += f"{POINT_RULES[rule][1]} points\n"
                 embed.add_field(name="Rules", value="Only 1 rule is applied towards each number", inline=False)
-                embed.add_field(name="Numbers", value=rules, inline=True)
-                embed.add_field(name="Points", value=values, inline=True)
+                embed.add_field(name="Numbers", value=RULE_NAMES, inline=True)
+                embed.add_field(name="Points", value=RULE_POINTS, inline=True)
             else:
                 # Add description
-                embed.description = f"**Countdown Channel:** <#{countdown}>\n\n"
-                embed.description += f"**User:** <@{data[0]['userid']}>\n"
-                embed.description += f"**Rank:** #{data[0]['ranking']:,}\n"
-                embed.description += f"**Total Points:** {data[0]['total']:,}\n"
-                embed.description += f"**Total Contributions:** {data[0]['contributions']:,} *({round(data[0]['percentage'])}%)*\n"
+                lines = [
+                    f"**Countdown Channel:** <#{countdown}>",
+                    "",
+                    f"**User:** <@{data[0]['userid']}>",
+                    f"**Rank:** #{data[0]['ranking']:,}",
+                    f"**Total Points:** {data[0]['total']:,}",
+                    f"**Total Contributions:** {data[0]['contributions']:,} *({round(data[0]['percentage'])}%)*",
+                ]
+                embed.description = "\n".join(lines)
 
                 # Add points breakdown
-                rules = ""
-                points = ""
-                percentage = ""
-                for rule in POINT_RULES:
-                    rules += f"{POINT_RULES[rule][0]}\n"
-                    points += f"{data[0][rule] * POINT_RULES[rule][1]:,} *({data[0][rule]:,})*\n"
-                    if (data[0]['total'] > 0):
-                        percentage += f"{round(data[0][rule] * POINT_RULES[rule][1] / data[0]['total'] * 100, 1)}%\n"
-                    else:
-                        percentage += "0%\n"
-                embed.add_field(name="Category", value=rules, inline=True)
+                rulePoints = {rule: data[0][rule] * value for rule, (name, value) in POINT_RULES.items()}
+                points = "\n".join([f"{rulePoints[rule]:,} *({data[0][rule]:,})*" for rule in POINT_RULES])
+                if (data[0]['total'] > 0):
+                    percentage = "\n".join([f"{round(rulePoints[rule] / data[0]['total'] * 100, 1)}%" for rule in POINT_RULES])
+                else:
+                    percentage = "\n".join(["0%"] * len(POINT_RULES))
+                embed.add_field(name="Category", value=RULE_NAMES, inline=True)
                 embed.add_field(name="Points", value=points, inline=True)
                 embed.add_field(name="Percentage", value=percentage, inline=True)
 
@@ -408,16 +481,11 @@ class Analytics(commands.Cog):
             if not countdown:
                 raise CountdownNotFound()
 
-            # Create temp file
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-            tmp.close()
-
             # Create embed
             embed=discord.Embed(title=":chart_with_downwards_trend: Countdown Progress", color=COLORS["embed"])
 
             # Get progress stats
-            cur.execute("SELECT * FROM progressData(%s);", (countdown,))
-            data = cur.fetchall()
+            data = self.getData(cur, "progressData", countdown)
             cur.execute("CALL progressStats(%s,null,null,null,null,null,null,null,null,null,null,null,null);", (countdown,))
             stats = cur.fetchone()
 
@@ -425,19 +493,20 @@ class Analytics(commands.Cog):
                 raise CommandError("The countdown doesn't have enough messages yet")
 
             # Create figure
-            fig, ax = plt.subplots()
+            fig = Figure()
+            ax = fig.subplots()
             ax.set_xlabel("Time")
             ax.set_ylabel("Progress")
             fig.autofmt_xdate()
 
             # Add data to graph
-            x = [data[0]["_timestamp"]] + [x["_timestamp"] for x in data]
-            y = [0] + [x["progress"] for x in data]
+            points = downsample(data)
+            x = [data[0]["_timestamp"]] + [x["_timestamp"] for x in points]
+            y = [0] + [x["progress"] for x in points]
             ax.plot(x, y)
 
             # Save graph
-            fig.savefig(tmp.name, bbox_inches="tight", pad_inches=0.2)
-            file = discord.File(tmp.name, filename="image.png")
+            file = await saveFigure(fig)
 
             # Calculate embed data
             longestBreakDuration = timedelta(days=stats["longestbreak"].days, seconds=stats["longestbreak"].seconds)
@@ -445,28 +514,23 @@ class Analytics(commands.Cog):
             longestBreakEnd = stats["longestbreakend"].date()
 
             # Add content to embed
-            embed.description = f"**Countdown Channel:** <#{countdown}>\n\n"
-            embed.description += f"**Progress:** {stats['progress']:,} / {stats['total']:,} ({stats['percentage']:.1f}%)\n"
-            embed.description += f"**Average Progress per Day:** {stats['rate']:,.0f}\n"
-            embed.description += f"**Longest Break:** {longestBreakDuration} ({stats['longestbreakstart'].date()} to {stats['longestbreakend'].date()})\n"
-            embed.description += f"**Start Date:** {stats['starttime'].date()} ({stats['startage'].days:,} days ago)\n"
+            lines = [
+                f"**Countdown Channel:** <#{countdown}>",
+                "",
+                f"**Progress:** {stats['progress']:,} / {stats['total']:,} ({stats['percentage']:.1f}%)",
+                f"**Average Progress per Day:** {stats['rate']:,.0f}",
+                f"**Longest Break:** {longestBreakDuration} ({longestBreakStart} to {longestBreakEnd})",
+                f"**Start Date:** {stats['starttime'].date()} ({stats['startage'].days:,} days ago)",
+            ]
             if stats['endage'] > timedelta(seconds=0):
-                embed.description += f"**End Date:** {stats['endtime'].date()} ({stats['endage'].days:,} days ago)\n"
+                lines.append(f"**End Date:** {stats['endtime'].date()} ({stats['endage'].days:,} days ago)")
             else:
-                embed.description += f"**Estimated End Date:** {stats['endtime'].date()} ({(-1 * stats['endage']).days:,} days from now)\n"
+                lines.append(f"**Estimated End Date:** {stats['endtime'].date()} ({(-1 * stats['endage']).days:,} days from now)")
+            embed.description = "\n".join(lines)
             embed.set_image(url="attachment://image.png")
 
         # Send embed
-        try:
-            await ctx.send(file=file, embed=embed)
-        except:
-            await ctx.send(embed=embed)
-
-        # Remove temp file
-        try:
-            os.remove(tmp.name)
-        except Exception as e:
-            self.bot.logger.error(f"Unable to delete temp file {tmp.name}", exc_info=e)
+        await ctx.send(file=file, embed=embed)
 
 
 
@@ -482,10 +546,6 @@ class Analytics(commands.Cog):
             if not countdown:
                 raise CountdownNotFound()
 
-            # Create temp file
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-            tmp.close()
-
             # Create embed
             embed=discord.Embed(title=":stopwatch: Countdown Speed", color=COLORS["embed"])
 
@@ -503,19 +563,18 @@ class Analytics(commands.Cog):
                 raise CommandError("The countdown doesn't have enough messages yet")
 
             # Create figure
-            fig, ax = plt.subplots()
+            fig = Figure()
+            ax = fig.subplots()
             ax.set_xlabel("Time")
             ax.set_ylabel("Progress per Period")
             fig.autofmt_xdate()
 
             # Add data to graph
             period = timedelta(hours=period)
-            for row in data:
-                ax.bar(row["periodstart"], row["messages"], width=period, align="edge", color="#1f77b4")
+            ax.bar([x["periodstart"] for x in data], [x["messages"] for x in data], width=period, align="edge", color="#1f77b4")
 
             # Save graph
-            fig.savefig(tmp.name, bbox_inches="tight", pad_inches=0.2)
-            file = discord.File(tmp.name, filename="image.png")
+            file = await saveFigure(fig)
 
             # Calculate embed data
             maxSpeed = max([x["messages"] for x in data])
@@ -524,22 +583,17 @@ class Analytics(commands.Cog):
             curPeriod = data[-1]["periodstart"]
 
             # Add content to embed
-            embed.description = f"**Countdown Channel:** <#{countdown}>\n\n"
-            embed.description += f"**Period Size:** {period}\n"
-            embed.description += f"**Average Progress per Period:** {avgSpeed:,}\n"
-            embed.description += f"**Record Progress per Period:** {maxSpeed:,}\n"
-            embed.description += f"**Last Period Start:** {curPeriod}\n"
-            embed.description += f"**Progress during Last Period:** {curSpeed:,}\n"
+            lines = [
+                f"**Countdown Channel:** <#{countdown}>",
+                "",
+                f"**Period Size:** {period}",
+                f"**Average Progress per Period:** {avgSpeed:,}",
+                f"**Record Progress per Period:** {maxSpeed:,}",
+                f"**Last Period Start:** {curPeriod}",
+                f"**Progress during Last Period:** {curSpeed:,}",
+            ]
+            embed.description = "\n".join(lines)
             embed.set_image(url="attachment://image.png")
 
         # Send embed
-        try:
-            await ctx.send(file=file, embed=embed)
-        except:
-            await ctx.send(embed=embed)
-
-        # Remove temp file
-        try:
-            os.remove(tmp.name)
-        except Exception as e:
-            self.bot.logger.error(f"Unable to delete temp file {tmp.name}", exc_info=e)
+        await ctx.send(file=file, embed=embed)
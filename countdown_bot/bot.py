@@ -6,7 +6,7 @@ import logging
 
 # Import modules
 from . import analyticsCog, coreCog, helpCog
-from .botUtilities import addMessage, COLORS, CountdownNotFound, ContributorNotFound, CommandError, getPrefix
+from .botUtilities import addMessage, COLORS, CountdownNotFound, ContributorNotFound, CommandError, clearPrefixCache, getPrefix
 
 
 
@@ -51,8 +51,10 @@ class CountdownBot(commands.Bot):
 
 
     async def on_command_error(self, ctx, error):
-        # Rollback database transaction
+        # Rollback database transaction (cached prefixes may include changes
+        # that were rolled back)
         self.db_connection.rollback()
+        clearPrefixCache()
 
         # Send error embed
         embed=discord.Embed(title=":warning: Error", description=str(error), color=COLORS["error"])
@@ -1,5 +1,10 @@
 # Import dependencies
+import asyncio
+from collections import OrderedDict
 import discord
+import functools
+import io
+import math
 import re
 
 
@@ -10,6 +15,23 @@ COLORS = {
 
 
 
+# Precompiled patterns for parsing message content
+NUMBER_PATTERN = re.compile(r"^[0-9,]+")
+MENTION_PATTERN = re.compile(r"^<@\d+>$")
+
+
+
+# Recently fetched usernames of users outside of the bot's user cache, by user ID
+USERNAMES = OrderedDict()
+USERNAMES_SIZE = 1024
+
+
+
+# Prevents figures from being rendered concurrently
+FIGURE_LOCK = asyncio.Lock()
+
+
+
 # Error classes
 class CommandError(Exception):
     """Raised when a command encounters an anticipated error"""
@@ -39,10 +61,73 @@ POINT_RULES = {
 
 
 
+def downsample(values, limit=1000):
+    """
+    Reduce the number of points in a graph series
+
+    Notes
+    -----
+    Every nth value is kept so that at most `limit` values remain, and the last
+    value is always kept so that the series ends at the correct point
+
+    Parameters
+    ----------
+    values : list
+        The series values
+    limit : int
+        The maximum number of values to keep
+
+    Returns
+    -------
+    list
+        The downsampled series values
+    """
+
+    if (len(values) <= limit):
+        return values
+
+    step = math.ceil((len(values) - 1) / (limit - 1))
+    return values[:-1:step] + values[-1:]
+
+
+
+async def saveFigure(fig):
+    """
+    Render a figure as a PNG image without blocking the event loop
+
+    Notes
+    -----
+    Figures are rendered one at a time in a worker thread
+
+    Parameters
+    ----------
+    fig : matplotlib.figure.Figure
+        The figure
+
+    Returns
+    -------
+    discord.File
+        The PNG image
+    """
+
+    buffer = io.BytesIO()
+    async with FIGURE_LOCK:
+        await asyncio.get_running_loop().run_in_executor(None, functools.partial(
+            fig.savefig, buffer, format="png", bbox_inches="tight", pad_inches=0.2))
+    buffer.seek(0)
+    return discord.File(buffer, filename="image.png")
+
+
+
 async def getUsername(bot, id):
     """
     Get a username from a user ID
 
+    Notes
+    -----
+    Usernames of users that aren't in the bot's user cache are cached, up to
+    USERNAMES_SIZE of them
+
     Parameters
     ----------
     bot : commands.Bot
@@ -56,8 +141,19 @@ async def getUsername(bot, id):
         The username
     """
 
-    user = await bot.fetch_user(id)
-    return user.name
+    # Use the bot's user cache (it is kept up to date by the gateway)
+    user = bot.get_user(id)
+    if (user):
+        return user.name
+
+    # Fetch users that aren't in the bot's user cache
+    if (id in USERNAMES):
+        USERNAMES.move_to_end(id)
+    else:
+        USERNAMES[id] = (await bot.fetch_user(id)).name
+        if (len(USERNAMES) > USERNAMES_SIZE):
+            USERNAMES.popitem(last=False)
+    return USERNAMES[id]
 
 
 
@@ -85,7 +181,7 @@ async def getContributor(bot, countdown, text):
         If a matching contributor cannot be found
     """
 
-    if (re.match("^<@\d+>$", text)):
+    if (MENTION_PATTERN.match(text)):
         return int(text[2:-1])
 
     raise ContributorNotFound(text)
@@ -162,11 +258,77 @@ def getPrefix(conn, ctx, default):
         The default prefix
     """
 
+    prefixes = getServerPrefixes(conn,
+        ctx.channel.guild.id if ctx.channel.guild else None, ctx.channel.id)
+    return list(prefixes) if prefixes else [default]
+
+
+
+@functools.lru_cache(maxsize=1024)
+def getServerPrefixes(conn, server, channel):
+    """
+    Get the active prefixes for a server channel
+
+    Notes
+    -----
+    Results are cached until clearPrefixCache is called
+
+    Parameters
+    ----------
+    conn : psycopg.Connection
+        The database connection
+    server : int
+        The server ID (or None for DMs)
+    channel : int
+        The channel ID
+
+    Returns
+    -------
+    tuple
+        The active prefixes
+    """
+
     with conn.cursor() as cur:
-        cur.execute("SELECT * FROM getServerPrefixes(%s, %s);",
-            (ctx.channel.guild.id if ctx.channel.guild else None, ctx.channel.id))
-        prefixes = cur.fetchall()
-        return [x["prefix"] for x in prefixes] if prefixes else [default]
+        cur.execute("SELECT * FROM getServerPrefixes(%s, %s);", (server, channel))
+        return tuple([x["prefix"] for x in cur.fetchall()])
+
+
+
+def clearPrefixCache():
+    """
+    Clear the cached prefixes
+
+    Notes
+    -----
+    Must be called after countdowns or their prefixes change (or a transaction
+    that might have changed them is rolled back)
+    """
+
+    getServerPrefixes.cache_clear()
+
+
+
+def parseNumber(message):
+    """
+    Parse the number at the start of a message
+
+    Parameters
+    ----------
+    message : discord.Message
+        The Discord message object
+
+    Returns
+    -------
+    int
+        The message number, or None if the message doesn't start with a number
+    """
+
+    if (message.content.isascii() and message.content.isdigit()):
+        # Message only contains a number
+        return int(message.content)
+    match = NUMBER_PATTERN.match(message.content)
+    if not match: return None
+    return int(match[0].replace(",", ""))
 
 
 
@@ -192,9 +354,8 @@ async def addMessage(cur, message):
     """
 
     # Parse message number
-    match = re.search("^[0-9,]+", message.content)
-    if not match: return False
-    number = int(match[0].replace(",", ""))
+    number = parseNumber(message)
+    if number is None: return False
 
     # Attempt to add result
     cur.execute("CALL addMessage(%s,%s,%s,%s,%s,null,null,null);", (
@@ -228,24 +389,69 @@ async def loadCountdown(bot, countdown):
     ----------
     bot : commands.Bot
         The bot to load messages with
-    cur : psycopg.cursor
-        The database cursor
     countdown : int
         The ID of the countdown to load messages for
+
+    Returns
+    -------
+    int
+        The ID of the latest message that was loaded (or 0 if there were none)
     """
 
     with bot.db_connection.cursor() as cur:
-        # Clear countdown
-        cur.execute("CALL clearCountdown(%s);", (countdown,))
-
-        # Get Discord messages
+        # Get Discord messages (newest first)
         messages = [message async for message in
                        bot.get_channel(countdown).history(limit=10100)]
-        messages.reverse()
 
-        # Add messages to countdown
-        for message in messages:
-            await addMessage(cur, message)
+        # Clear countdown (after fetching messages, so the countdown isn't left
+        # half-cleared while awaiting Discord)
+        cur.execute("CALL clearCountdown(%s);", (countdown,))
+
+        # Parse message numbers in chronological order
+        rows = []
+        for message in reversed(messages):
+            number = parseNumber(message)
+            if number is not None:
+                rows.append((message.id, countdown, message.author.id, number,
+                    message.created_at))
+
+        # Add messages to countdown in one batch (historical messages don't get
+        # reactions or pins)
+        cur.executemany("CALL addMessage(%s,%s,%s,%s,%s,null,null,null);", rows)
 
     # Commit changes
     bot.db_connection.commit()
+
+    return messages[0].id if messages else 0
+
+
+
+async def loadNewMessages(bot, countdown, after):
+    """
+    Loads countdown messages sent after a certain message
+
+    Parameters
+    ----------
+    bot : commands.Bot
+        The bot to load messages with
+    countdown : int
+        The ID of the countdown to load messages for
+    after : int
+        The ID of the latest message already in the countdown
+
+    Returns
+    -------
+    int
+        The ID of the latest message that was loaded
+    """
+
+    with bot.db_connection.cursor() as cur:
+        # Add new Discord messages to countdown in chronological order
+        # (committing each one so it isn't lost if another command rolls back)
+        async for message in bot.get_channel(countdown).history(limit=None,
+                after=discord.Object(id=after), oldest_first=True):
+            if (await addMessage(cur, message)):
+                bot.db_connection.commit()
+            after = message.id
+
+    return after
@@ -1,10 +1,12 @@
 # Import dependencies
+import asyncio
+from collections import defaultdict
 import discord
 from discord.ext import commands
 from datetime import timedelta
 
 # Import modules
-from .botUtilities import COLORS, CommandError, CountdownNotFound, isCountdown, loadCountdown, getContextCountdown, addMessage
+from .botUtilities import COLORS, CommandError, CountdownNotFound, clearPrefixCache, isCountdown, loadCountdown, loadNewMessages, getContextCountdown, addMessage
 
 
 
@@ -12,15 +14,64 @@ class Core(commands.Cog):
     def __init__(self, bot, db_connection):
         self.bot = bot
         self.db_connection = db_connection
+        self.countdowns = set()
+        self.locks = defaultdict(asyncio.Lock)
+        self.loadedMessages = {}
+        self.catchingUp = False
+
+
+
+    async def cog_load(self):
+        # Cache countdown channel IDs
+        with self.db_connection.cursor() as cur:
+            cur.execute("SELECT * FROM getCountdowns();")
+            self.countdowns = set([x["countdownid"] for x in cur.fetchall()])
+
+
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # Make sure only one catch-up runs at a time (on_ready fires again after
+        # reconnecting)
+        if (self.catchingUp):
+            return
+        self.catchingUp = True
+
+        try:
+            for countdown in list(self.countdowns):
+                if (not self.bot.get_channel(countdown)):
+                    continue
+
+                # Hold the countdown lock so new messages wait for the catch-up
+                async with self.locks[countdown]:
+                    # Get latest countdown message
+                    with self.db_connection.cursor() as cur:
+                        cur.execute("CALL getCountdownVersion(%s, null, null, null);", (countdown,))
+                        lastMessageID = cur.fetchone()["lastmessageid"]
+
+                    # Load messages that were sent while the bot was offline
+                    if (lastMessageID):
+                        self.loadedMessages[countdown] = await loadNewMessages(self.bot, countdown, lastMessageID)
+        finally:
+            self.catchingUp = False
 
 
 
     @commands.Cog.listener()
     async def on_message(self, obj):
-        # Parse countdown message
-        with self.db_connection.cursor() as cur:
-            if (await addMessage(cur, obj)):
-                self.db_connection.commit()
+        # Ignore messages outside of countdown channels
+        if (obj.channel.id not in self.countdowns):
+            return
+
+        async with self.locks[obj.channel.id]:
+            # Ignore messages that were already loaded during a catch-up or reload
+            if (obj.id <= self.loadedMessages.get(obj.channel.id, 0)):
+                return
+
+            # Parse countdown message
+            with self.db_connection.cursor() as cur:
+                if (await addMessage(cur, obj)):
+                    self.db_connection.commit()
 
 
 
@@ -52,9 +103,12 @@ class Core(commands.Cog):
             embed = discord.Embed(title=":clock3: Loading Countdown", description="This channel is now a countdown\nPlease wait to start counting", color=COLORS["embed"])
             msg = await ctx.send(embed=embed)
 
-            # Load countdown
-            await loadCountdown(self.bot, ctx.channel.id)
-            self.db_connection.commit()
+            # Load countdown (holding the countdown lock so new messages wait)
+            async with self.locks[ctx.channel.id]:
+                self.loadedMessages[ctx.channel.id] = await loadCountdown(self.bot, ctx.channel.id)
+                self.db_connection.commit()
+                self.countdowns.add(ctx.channel.id)
+            clearPrefixCache()
 
             # Send final response
             embed = discord.Embed(title=":white_check_mark: Countdown Activated", description="This channel is now a countdown\nYou may start counting!", color=COLORS["embed"])
@@ -103,8 +157,11 @@ class Core(commands.Cog):
                     embed.description += f"**Reactions:** none\n"
                 else:
                     embed.description += f"**Reactions:**\n"
-                for number in reversed(list(set([x["number"] for x in reactions]))):
-                    embed.description += f"**-** #{number}: {', '.join([x["value"] for x in reactions if x["number"] == number])}\n"
+                grouped = {}
+                for reaction in reactions:
+                    grouped.setdefault(reaction["number"], []).append(reaction["value"])
+                for number, values in grouped.items():
+                    embed.description += f"**-** #{number}: {', '.join(values)}\n"
 
                 embed.description += f"\nUse `{ctx.prefix}help config` to view more information about settings\n"
                 embed.description += f"Use `{ctx.prefix}config <key> <value>` to modify settings\n"
@@ -144,6 +201,8 @@ class Core(commands.Cog):
 
             # Save changes
             self.db_connection.commit()
+            if (key in ["prefix", "prefixes"]):
+                clearPrefixCache()
 
         # Send embed
         await ctx.send(embed=embed)
@@ -169,6 +228,9 @@ class Core(commands.Cog):
             cur.execute("CALL deleteCountdown(%s);",
                 (ctx.channel.id,))
             self.db_connection.commit()
+            self.countdowns.discard(ctx.channel.id)
+            self.bot.get_cog("Analytics").clearCache(ctx.channel.id)
+            clearPrefixCache()
 
             # Send response
             self.bot.logger.info(f"Deactivated {self.bot.get_channel(ctx.channel.id)} (ID {ctx.channel.id}) as a countdown")
@@ -192,9 +254,10 @@ class Core(commands.Cog):
             embed = discord.Embed(title=":clock3: Reloading Countdown Cache", description="Please wait to continue counting", color=COLORS["embed"])
             msg = await ctx.channel.send(embed=embed)
 
-            # Reload messages
-            await loadCountdown(self.bot, ctx.channel.id)
-            self.db_connection.commit()
+            # Reload messages (holding the countdown lock so new messages wait)
+            async with self.locks[ctx.channel.id]:
+                self.loadedMessages[ctx.channel.id] = await loadCountdown(self.bot, ctx.channel.id)
+                self.db_connection.commit()
 
             # Send final response
             self.bot.logger.info(f"Reloaded messages from {self.bot.get_channel(ctx.channel.id)} (ID {ctx.channel.id})")
@@ -1,12 +1,205 @@
 # Import dependencies
 import discord
 from discord.ext import commands
+import functools
+import types
 
 # Import modules
 from .botUtilities import COLORS, CommandError
 
 
 
+@functools.lru_cache(maxsize=16)
+def getHelpText(prefix):
+    """
+    Get the help information for a command prefix
+
+    Notes
+    -----
+    Help information is only generated once for each prefix
+
+    Parameters
+    ----------
+    prefix : str
+        The command prefix to use in examples
+
+    Returns
+    -------
+    types.MappingProxyType
+        The help information sections (read-only, since it is shared between
+        calls)
+    """
+
+    return types.MappingProxyType({
+        "utility-commands":
+            "**-** `activate`: Turns a channel into a countdown\n" \
+            "**-** `config`: Shows and modifies bot and countdown settings\n" \
+            "**-** `deactivate`: Deactivates a countdown channel\n" \
+            "**-** `help`, `h`: Shows help information\n" \
+            "**-** `ping`: Pings the bot\n" \
+            "**-** `reload`: Reloads the countdown cache\n",
+        "analytics-commands":
+            "**-** `analytics`, `a`: Shows all countdown analytics\n" \
+            "**-** `contributors`, `c`: Shows information about countdown contributors\n" \
+            "**-** `eta`, `e`: Shows information about the estimated completion date\n" \
+            "**-** `heatmap`: Shows a heatmap of when messages are sent\n" \
+            "**-** `leaderboard`, `l`: Shows the countdown leaderboard\n" \
+            "**-** `progress`, `p`: Shows information about countdown progress\n" \
+            "**-** `speed`, `s`: Shows information about countdown speed\n",
+        "behavior":
+            "**-** Reacts with :no_entry: when a user counts out of turn\n" \
+            "**-** Reacts with :x: when a user counts incorrectly\n" \
+            "**-** Ignores messages that don't start with a (positive) number\n" \
+            "**-** Pins numbers every 2% if the countdown started at 500 or higher\n",
+        "getting-started":
+            f"**1.** View help information using the `{prefix}help` command\n" \
+            f"**2.** Activate a new countdown channel using the `{prefix}activate` command\n" \
+            f"**3.** Change my settings using the `{prefix}config` command\n" \
+            f"**4.** View countdown analytics using the `{prefix}analytics` command\n",
+        "troubleshooting":
+            f"**1.** Run `{prefix}ping` to make sure that I'm online\n" \
+            f"**2.** If I reacted incorrectly to a message, remove my incorrect reaction(s)\n" \
+            f"**3.** Run `{prefix}reload` in the countdown channel\n",
+        "activate":
+            "**Name:** activate\n" \
+            "**Description:** Turns a channel into a countdown\n" \
+            f"**Usage:** `{prefix}activate`\n" \
+            "**Aliases:** none\n" \
+            "**Arguments:** none\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}activate`\n" \
+            "**Notes:** Users must have admin permissions to turn a channel into a countdown\n",
+        "analytics":
+            "**Name:** analytics\n" \
+            "**Description:** Shows all countdown analytics\n" \
+            f"**Usage:** `{prefix}analytics|a`\n" \
+            "**Aliases:** `a`\n" \
+            "**Arguments: none**\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}analytics`\n" \
+            "**Notes:** none\n",
+        "config":
+            "**Name:** config\n" \
+            "**Description:** Shows and modifies countdown settings\n" \
+            f"**Usage:** `{prefix}config [<key> <value>...]`\n" \
+            "**Aliases:** none\n" \
+            "**Arguments:**\n" \
+            "**-** `<key>`: The name of the setting to modify. If no key is supplied, all settings will be shown\n" \
+            "**-** `<value>`: The new value(s) for the setting\n" \
+            "**Available Settings:**\n" \
+            "**-** `prefix`, `prefixes`: The prefix(es) for the bot\n" \
+            "**-** `tz`, `timezone`: The UTC offset in hours\n" \
+            "**-** `react`: The reactions for a certain number\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}config`\n" \
+            f"**-** `{prefix}config prefixes prefix1 prefix2 prefix3`\n" \
+            f"**-** `{prefix}config timezone -1.5`\n" \
+            f"**-** `{prefix}config react 0 :partying_face: :smile:`\n" \
+            "**Notes:** Users must have admin permissions to modify settings\n",
+        "contributors":
+            "**Name:** contributors\n" \
+            "**Description:** Shows information about countdown contributors\n" \
+            f"**Usage:** `{prefix}contributors|c [history|h]`\n" \
+            "**Aliases:** `c`\n" \
+            "**Arguments:**\n" \
+            "**-** `history`, `h`: Shows historical data about countdown contributors\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}contributors`\n" \
+            f"**-** `{prefix}contributors history`\n" \
+            "**Notes:** The contributors embed will only show the top 20 contributors\n",
+        "deactivate":
+            "**Name:** deactivate\n" \
+            "**Description:** Deactivates a countdown channel\n" \
+            f"**Usage:** `{prefix}deactivate`\n" \
+            "**Aliases:** none\n" \
+            "**Arguments:** none\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}deactivate`\n" \
+            "**Notes:** Users must have admin permissions to deactivate a countdown channel\n",
+        "eta":
+            "**Name:** eta\n" \
+            "**Description:** Shows information about the estimated completion date\n" \
+            f"**Usage:** `{prefix}eta|e`\n" \
+            "**Aliases:** `e`\n" \
+            "**Arguments:** none\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}eta`\n" \
+            "**Notes:** none\n",
+        "heatmap":
+            "**Name:** heatmap\n" \
+            "**Description:** Shows a heatmap of when countdown messages are sent\n" \
+            f"**Usage:** `{prefix}heatmap [<user>]`\n" \
+            "**Aliases:** none\n" \
+            "**Arguments:**\n" \
+            "**-** `<user>`: The user to view heatmap information about. If no value is supplied, the general heatmap will be shown\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}heatmap`\n" \
+            f"**-** `{prefix}heatmap @Alice`\n" \
+            "**Notes:** none\n",
+        "help":
+            "**Name:** help\n" \
+            "**Description:** Shows help information\n" \
+            f"**Usage:** `{prefix}help|h [<command>]`\n" \
+            "**Aliases:** `h`\n" \
+            "**Arguments:**\n" \
+            "**-** `<command>`: The command to view help information about. If no value is supplied, general help information will be shown\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}help`\n" \
+            f"**-** `{prefix}help config`\n" \
+            "**Notes:** none\n",
+        "leaderboard":
+            "**Name:** leaderboard\n" \
+            "**Description:** Shows the countdown leaderboard\n" \
+            f"**Usage:** `{prefix}leaderboard|l [<user>]`\n" \
+            "**Aliases:** `l`\n" \
+            "**Arguments:**\n" \
+            "**-** `<user>`: The user to view leaderboard information about. If no value is supplied, the whole leaderboard will be shown\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}leaderboard`\n" \
+            f"**-** `{prefix}leaderboard @Alice`\n" \
+            "**Notes:** The leaderboard embed will only show the top 20 contributors\n",
+        "ping":
+            "**Name:** ping\n" \
+            "**Description:** Pings the bot\n" \
+            f"**Usage:** `{prefix}ping`\n" \
+            "**Aliases:** none\n" \
+            "**Arguments:** none\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}ping`\n" \
+            "**Notes:** none\n",
+        "progress":
+            "**Name:** progress\n" \
+            "**Description:** Shows information about countdown progress\n" \
+            f"**Usage:** `{prefix}progress|p`\n" \
+            "**Aliases:** `p`\n" \
+            "**Arguments:** none\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}progress`\n" \
+            "**Notes:** none\n",
+        "reload":
+            "**Name:** reload\n" \
+            "**Description:** Reloads the countdown cache\n" \
+            f"**Usage:** `{prefix}reload`\n" \
+            "**Aliases:** none\n" \
+            "**Arguments:** none\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}reload`\n" \
+            "**Notes:** This command must be used in a countdown channel\n",
+        "speed":
+            "**Name:** speed\n" \
+            "**Description:** Shows information about countdown speed\n" \
+            f"**Usage:** `{prefix}speed|s [<period>]`\n" \
+            "**Aliases:** `s`\n" \
+            "**Arguments:**\n" \
+            "**-** `<period>`: The size of the period in hours (the default is 24 hours)\n" \
+            "**Examples:**\n" \
+            f"**-** `{prefix}speed`\n" \
+            f"**-** `{prefix}speed 48`\n" \
+            "**Notes:** none\n",
+    })
+
+
+
 class Help(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
@@ -50,182 +243,14 @@ class Help(commands.Cog):
         Shows help information
         """
 
-        # Initialize help information
+        # Get help information
         prefixes = await self.bot.get_prefix(ctx)
-        help_text = {
-            "prefixes":
-                f"`{'`, `'.join(prefixes)}`",
-            "utility-commands":
-                "**-** `activate`: Turns a channel into a countdown\n" \
-                "**-** `config`: Shows and modifies bot and countdown settings\n" \
-                "**-** `deactivate`: Deactivates a countdown channel\n" \
-                "**-** `help`, `h`: Shows help information\n" \
-                "**-** `ping`: Pings the bot\n" \
-                "**-** `reload`: Reloads the countdown cache\n",
-            "analytics-commands":
-                "**-** `analytics`, `a`: Shows all countdown analytics\n" \
-                "**-** `contributors`, `c`: Shows information about countdown contributors\n" \
-                "**-** `eta`, `e`: Shows information about the estimated completion date\n" \
-                "**-** `heatmap`: Shows a heatmap of when messages are sent\n" \
-                "**-** `leaderboard`, `l`: Shows the countdown leaderboard\n" \
-                "**-** `progress`, `p`: Shows information about countdown progress\n" \
-                "**-** `speed`, `s`: Shows information about countdown speed\n",
-            "behavior":
-                "**-** Reacts with :no_entry: when a user counts out of turn\n" \
-                "**-** Reacts with :x: when a user counts incorrectly\n" \
-                "**-** Ignores messages that don't start with a (positive) number\n" \
-                "**-** Pins numbers every 2% if the countdown started at 500 or higher\n",
-            "getting-started":
-                f"**1.** View help information using the `{prefixes[0]}help` command\n" \
-                f"**2.** Activate a new countdown channel using the `{prefixes[0]}activate` command\n" \
-                f"**3.** Change my settings using the `{prefixes[0]}config` command\n" \
-                f"**4.** View countdown analytics using the `{prefixes[0]}analytics` command\n",
-            "troubleshooting":
-                f"**1.** Run `{prefixes[0]}ping` to make sure that I'm online\n" \
-                f"**2.** If I reacted incorrectly to a message, remove my incorrect reaction(s)\n" \
-                f"**3.** Run `{prefixes[0]}reload` in the countdown channel\n",
-            "activate":
-                "**Name:** activate\n" \
-                "**Description:** Turns a channel into a countdown\n" \
-                f"**Usage:** `{prefixes[0]}activate`\n" \
-                "**Aliases:** none\n" \
-                "**Arguments:** none\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}activate`\n" \
-                "**Notes:** Users must have admin permissions to turn a channel into a countdown\n",
-            "analytics":
-                "**Name:** analytics\n" \
-                "**Description:** Shows all countdown analytics\n" \
-                f"**Usage:** `{prefixes[0]}analytics|a`\n" \
-                "**Aliases:** `a`\n" \
-                "**Arguments: none**\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}analytics`\n" \
-                "**Notes:** none\n",
-            "config":
-                "**Name:** config\n" \
-                "**Description:** Shows and modifies countdown settings\n" \
-                f"**Usage:** `{prefixes[0]}config [<key> <value>...]`\n" \
-                "**Aliases:** none\n" \
-                "**Arguments:**\n" \
-                "**-** `<key>`: The name of the setting to modify. If no key is supplied, all settings will be shown\n" \
-                "**-** `<value>`: The new value(s) for the setting\n" \
-                "**Available Settings:**\n" \
-                "**-** `prefix`, `prefixes`: The prefix(es) for the bot\n" \
-                "**-** `tz`, `timezone`: The UTC offset in hours\n" \
-                "**-** `react`: The reactions for a certain number\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}config`\n" \
-                f"**-** `{prefixes[0]}config prefixes prefix1 prefix2 prefix3`\n" \
-                f"**-** `{prefixes[0]}config timezone -1.5`\n" \
-                f"**-** `{prefixes[0]}config react 0 :partying_face: :smile:`\n" \
-                "**Notes:** Users must have admin permissions to modify settings\n",
-            "contributors":
-                "**Name:** contributors\n" \
-                "**Description:** Shows information about countdown contributors\n" \
-                f"**Usage:** `{prefixes[0]}contributors|c [history|h]`\n" \
-                "**Aliases:** `c`\n" \
-                "**Arguments:**\n" \
-                "**-** `history`, `h`: Shows historical data about countdown contributors\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}contributors`\n" \
-                f"**-** `{prefixes[0]}contributors history`\n" \
-                "**Notes:** The contributors embed will only show the top 20 contributors\n",
-            "deactivate":
-                "**Name:** deactivate\n" \
-                "**Description:** Deactivates a countdown channel\n" \
-                f"**Usage:** `{prefixes[0]}deactivate`\n" \
-                "**Aliases:** none\n" \
-                "**Arguments:** none\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}deactivate`\n" \
-                "**Notes:** Users must have admin permissions to deactivate a countdown channel\n",
-            "eta":
-                "**Name:** eta\n" \
-                "**Description:** Shows information about the estimated completion date\n" \
-                f"**Usage:** `{prefixes[0]}eta|e`\n" \
-                "**Aliases:** `e`\n" \
-                "**Arguments:** none\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}eta`\n" \
-                "**Notes:** none\n",
-            "heatmap":
-                "**Name:** heatmap\n" \
-                "**Description:** Shows a heatmap of when countdown messages are sent\n" \
-                f"**Usage:** `{prefixes[0]}heatmap [<user>]`\n" \
-                "**Aliases:** none\n" \
-                "**Arguments:**\n" \
-                "**-** `<user>`: The user to view heatmap information about. If no value is supplied, the general heatmap will be shown\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}heatmap`\n" \
-                f"**-** `{prefixes[0]}heatmap @Alice`\n" \
-                "**Notes:** none\n",
-            "help":
-                "**Name:** help\n" \
-                "**Description:** Shows help information\n" \
-                f"**Usage:** `{prefixes[0]}help|h [<command>]`\n" \
-                "**Aliases:** `h`\n" \
-                "**Arguments:**\n" \
-                "**-** `<command>`: The command to view help information about. If no value is supplied, general help information will be shown\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}help`\n" \
-                f"**-** `{prefixes[0]}help config`\n" \
-                "**Notes:** none\n",
-            "leaderboard":
-                "**Name:** leaderboard\n" \
-                "**Description:** Shows the countdown leaderboard\n" \
-                f"**Usage:** `{prefixes[0]}leaderboard|l [<user>]`\n" \
-                "**Aliases:** `l`\n" \
-                "**Arguments:**\n" \
-                "**-** `<user>`: The user to view leaderboard information about. If no value is supplied, the whole leaderboard will be shown\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}leaderboard`\n" \
-                f"**-** `{prefixes[0]}leaderboard @Alice`\n" \
-                "**Notes:** The leaderboard embed will only show the top 20 contributors\n",
-            "ping":
-                "**Name:** ping\n" \
-                "**Description:** Pings the bot\n" \
-                f"**Usage:** `{prefixes[0]}ping`\n" \
-                "**Aliases:** none\n" \
-                "**Arguments:** none\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}ping`\n" \
-                "**Notes:** none\n",
-            "progress":
-                "**Name:** progress\n" \
-                "**Description:** Shows information about countdown progress\n" \
-                f"**Usage:** `{prefixes[0]}progress|p`\n" \
-                "**Aliases:** `p`\n" \
-                "**Arguments:** none\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}progress`\n" \
-                "**Notes:** none\n",
-            "reload":
-                "**Name:** reload\n" \
-                "**Description:** Reloads the countdown cache\n" \
-                f"**Usage:** `{prefixes[0]}reload`\n" \
-                "**Aliases:** none\n" \
-                "**Arguments:** none\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}reload`\n" \
-                "**Notes:** This command must be used in a countdown channel\n",
-            "speed":
-                "**Name:** speed\n" \
-                "**Description:** Shows information about countdown speed\n" \
-                f"**Usage:** `{prefixes[0]}speed|s [<period>]`\n" \
-                "**Aliases:** `s`\n" \
-                "**Arguments:**\n" \
-                "**-** `<period>`: The size of the period in hours (the default is 24 hours)\n" \
-                "**Examples:**\n" \
-                f"**-** `{prefixes[0]}speed`\n" \
-                f"**-** `{prefixes[0]}speed 48`\n" \
-                "**Notes:** none\n",
-        }
+        help_text = getHelpText(prefixes[0])
 
         # Create embed
         embed=discord.Embed(title=":grey_question: countdown-bot Help", color=COLORS["embed"])
         if (command is None):
-            embed.add_field(name="Command Prefixes :gear:", value=help_text["prefixes"], inline=False)
+            embed.add_field(name="Command Prefixes :gear:", value=f"`{'`, `'.join(prefixes)}`", inline=False)
             embed.add_field(name="Utility Commands :wrench:", value=help_text["utility-commands"], inline=False)
             embed.add_field(name="Analytics Commands :bar_chart:", value=help_text["analytics-commands"], inline=False)
             embed.add_field(name="Behavior in Countdown Channels :robot:", value=help_text["behavior"], inline=False)
@@ -12,6 +12,9 @@ CREATE TABLE countdowns (
     timezone INTERVAL NOT NULL DEFAULT '0' -- The preferred UTC offset
 );
 
+-- Finds the countdown channels in a server
+CREATE INDEX countdownsServer ON countdowns(serverID);
+
 -- Records contributions to countdowns
 CREATE TABLE messages (
     messageID BIGINT PRIMARY KEY,      -- The Discord message ID
@@ -19,11 +22,15 @@ CREATE TABLE messages (
     userID BIGINT NOT NULL,            -- The author's Discord user ID
     value INT NOT NULL,                -- The message's numeric value
     timestamp TIMESTAMPTZ NOT NULL,    -- The message timestamp
+    rule SMALLINT NOT NULL,            -- The leaderboard rule (see addMessage)
     FOREIGN KEY (countdownID)
         REFERENCES countdowns(countdownID)
         ON DELETE CASCADE
 );
 
+-- Finds the last (lowest) and first (highest) message in a countdown
+CREATE INDEX messagesCountdownValue ON messages(countdownID, value);
+
 -- Records bot command prefixes
 CREATE table prefixes (
     prefixID SERIAL PRIMARY KEY, -- The prefix ID
@@ -21,24 +21,19 @@ RETURNS TABLE (
     percentage FLOAT      -- The user's percentage of all contributions
 )
 LANGUAGE plpgsql AS $$
-DECLARE
-    progress INT;
 BEGIN
-    -- Get total countdown progress
-    SELECT count(messageID)
-    INTO progress
-    FROM messages
-    WHERE countdownID = _countdownID;
-
+    -- Count contributions and total progress in a single pass
     RETURN QUERY
     SELECT
         rank() OVER (ORDER BY count(messageID) DESC) AS ranking,
         messages.userID,
         count(messageID) AS contributions,
-        (100.0 * count(messageID) / progress)::float AS percentage
+        (100.0 * count(messageID) / sum(count(messageID)) OVER ())::float
+            AS percentage
     FROM messages
     WHERE countdownID = _countdownID
-    GROUP BY messages.userID;
+    GROUP BY messages.userID
+    ORDER BY count(messageID) DESC;
 END
 $$;
 
@@ -187,6 +182,18 @@ LANGUAGE plpgsql AS $$
 DECLARE
     total INT;
     progress INT;
+    -- The points awarded for each rule
+    rulePoints INT[] := ARRAY[
+        0,    -- First
+        1000, -- 1000s
+        500,  -- 1001s
+        200,  -- 200s
+        100,  -- 201s
+        100,  -- 100s
+        50,   -- 101s
+        12,   -- Odds
+        10    -- Evens
+    ];
 BEGIN
     -- Get total from first message
     SELECT value
@@ -210,48 +217,22 @@ BEGIN
         SELECT row_number() OVER (ORDER BY points.total DESC), *
         FROM (
             -- Count points and rule breakdowns for each user
-            SELECT categorizedMessages.userID,
-                sum(CASE rule
-                    WHEN 1 THEN 0    -- First
-                    WHEN 2 THEN 1000 -- 1000s
-                    WHEN 3 THEN 500  -- 1001s
-                    WHEN 4 THEN 200  -- 200s
-                    WHEN 5 THEN 100  -- 201s
-                    WHEN 6 THEN 100  -- 100s
-                    WHEN 7 THEN 50   -- 101s
-                    WHEN 8 THEN 12   -- Odds
-                    ELSE 10          -- Evens
-                END) AS total,
+            SELECT messages.userID,
+                sum(rulePoints[rule]) AS total,
                 count(rule) AS contributions,
                 (100.0 * count(rule) / progress)::float AS percentage,
-                sum(CASE rule WHEN 1 THEN 1 ELSE 0 END) AS r1,
-                sum(CASE rule WHEN 2 THEN 1 ELSE 0 END) AS r2,
-                sum(CASE rule WHEN 3 THEN 1 ELSE 0 END) AS r3,
-                sum(CASE rule WHEN 4 THEN 1 ELSE 0 END) AS r4,
-                sum(CASE rule WHEN 5 THEN 1 ELSE 0 END) AS r5,
-                sum(CASE rule WHEN 6 THEN 1 ELSE 0 END) AS r6,
-                sum(CASE rule WHEN 7 THEN 1 ELSE 0 END) AS r7,
-                sum(CASE rule WHEN 8 THEN 1 ELSE 0 END) AS r8,
-                sum(CASE rule WHEN 9 THEN 1 ELSE 0 END) AS r9
-            FROM (
-                -- Get qualifying rule for each message
-                SELECT
-                    messages.userID,
-                    CASE TRUE
-                        WHEN value=total  THEN 1 -- First
-                        WHEN value%1000=0 THEN 2 -- 1000s
-                        WHEN value%1000=1 THEN 3 -- 1001s
-                        WHEN value%200=0  THEN 4 -- 200s
-                        WHEN value%200=1  THEN 5 -- 201s
-                        WHEN value%100=0  THEN 6 -- 100s
-                        WHEN value%100=1  THEN 7 -- 101s
-                        WHEN value%2=1    THEN 8 -- Odds
-                        ELSE 9                   -- Evens
-                    END AS rule
-                FROM messages
-                WHERE countdownID = _countdownID
-            ) categorizedMessages
-            GROUP BY categorizedMessages.userID
+                count(*) FILTER (WHERE rule = 1) AS r1,
+                count(*) FILTER (WHERE rule = 2) AS r2,
+                count(*) FILTER (WHERE rule = 3) AS r3,
+                count(*) FILTER (WHERE rule = 4) AS r4,
+                count(*) FILTER (WHERE rule = 5) AS r5,
+                count(*) FILTER (WHERE rule = 6) AS r6,
+                count(*) FILTER (WHERE rule = 7) AS r7,
+                count(*) FILTER (WHERE rule = 8) AS r8,
+                count(*) FILTER (WHERE rule = 9) AS r9
+            FROM messages
+            WHERE countdownID = _countdownID
+            GROUP BY messages.userID
         ) points
     ) rankings
     WHERE rankings.userID = _userID OR _userID IS NULL;
@@ -389,13 +370,12 @@ BEGIN
 
     RETURN QUERY
     SELECT
-        to_timestamp(
-            floor(extract(epoch FROM timestamp AT TIME ZONE _timezone) / hours
-            / 3600)::int * hours * 3600
-        ) AT TIME ZONE '0:00' AS periodStart,
+        date_bin(hours * INTERVAL '1 hour', timestamp AT TIME ZONE _timezone,
+            TIMESTAMP '1970-01-01') AS periodStart,
         count(messageID) as messages
     FROM messages
     WHERE countdownID = _countdownID
-    GROUP BY periodStart;
+    GROUP BY periodStart
+    ORDER BY periodStart;
 END
 $$;
@@ -139,18 +139,34 @@ BEGIN
         result := 'badUser';
 
     ELSE
-        -- Message is valid, insert it into messages
-        INSERT INTO messages (messageID, userID, countdownID, value, timestamp)
-            VALUES (_messageID, _userID, _countdownID, _value, _timestamp);
-        result := 'good';
+        -- Get total from first message (countdowns only go down, so the first
+        -- message has the highest value)
+        IF lastMessage.value IS NULL THEN
+            total := _value;
+        ELSE
+            SELECT max(value)
+            INTO total
+            FROM messages
+            WHERE countdownID = _countdownID;
+        END IF;
 
-        -- Get total from first message
-        SELECT value
-        INTO total
-        FROM messages
-        WHERE countdownID = _countdownID
-        ORDER BY timestamp ASC
-        LIMIT 1;
+        -- Message is valid, insert it into messages along with the
+        -- leaderboard rule it qualifies for
+        INSERT INTO messages (messageID, userID, countdownID, value, timestamp,
+            rule)
+            VALUES (_messageID, _userID, _countdownID, _value, _timestamp,
+                CASE TRUE
+                    WHEN _value=total  THEN 1 -- First
+                    WHEN _value%1000=0 THEN 2 -- 1000s
+                    WHEN _value%1000=1 THEN 3 -- 1001s
+                    WHEN _value%200=0  THEN 4 -- 200s
+                    WHEN _value%200=1  THEN 5 -- 201s
+                    WHEN _value%100=0  THEN 6 -- 100s
+                    WHEN _value%100=1  THEN 7 -- 101s
+                    WHEN _value%2=1    THEN 8 -- Odds
+                    ELSE 9                    -- Evens
+                END);
+        result := 'good';
 
         -- Check if message should be pinned
         IF total >= 500 AND _value % (total / 50) = 0 AND _value != 0 THEN
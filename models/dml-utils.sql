@@ -1,9 +1,24 @@
 -- countdown-bot utility functions and procedures
 
 DROP PROCEDURE IF EXISTS isCountdown;
+DROP PROCEDURE IF EXISTS getCountdownVersion;
 DROP PROCEDURE IF EXISTS getUserContextCountdown;
 DROP PROCEDURE IF EXISTS getServerContextCountdown;
 DROP FUNCTION IF EXISTS getServerPrefixes;
+DROP FUNCTION IF EXISTS getCountdowns;
+
+-- Get all countdown channels
+CREATE FUNCTION getCountdowns ()
+RETURNS TABLE (
+    countdownID BIGINT -- The countdown channel ID
+)
+LANGUAGE plpgsql AS $$
+BEGIN
+    RETURN QUERY
+    SELECT countdowns.countdownID
+    FROM countdowns;
+END
+$$;
 
 -- Get the active prefixes for a server
 CREATE FUNCTION getServerPrefixes (
@@ -36,6 +51,28 @@ BEGIN
 END
 $$;
 
+-- Get values that change whenever messages are added to or removed from a
+-- countdown or its timezone is changed
+CREATE PROCEDURE getCountdownVersion (
+    _countdownID IN BIGINT,   -- The countdown channel ID
+    messageCount OUT BIGINT,  -- The number of messages in the countdown
+    lastMessageID OUT BIGINT, -- The ID of the latest message in the countdown
+    _timezone OUT INTERVAL    -- The countdown's preferred UTC offset
+)
+LANGUAGE plpgsql AS $$
+BEGIN
+    SELECT count(messageID), max(messageID)
+    INTO messageCount, lastMessageID
+    FROM messages
+    WHERE countdownID = _countdownID;
+
+    SELECT timezone
+    INTO _timezone
+    FROM countdowns
+    WHERE countdownID = _countdownID;
+END
+$$;
+
 -- Get the most relevant countdown to a server channel
 CREATE PROCEDURE getServerContextCountdown (
     _serverID IN BIGINT,   -- The server ID
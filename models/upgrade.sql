@@ -0,0 +1,36 @@
+-- countdown-bot upgrade for databases created before leaderboard rules and
+-- lookup indexes were stored (safe to run more than once)
+
+BEGIN;
+
+-- Store the leaderboard rule of each message (see addMessage)
+ALTER TABLE messages ADD COLUMN IF NOT EXISTS rule SMALLINT;
+
+UPDATE messages
+SET rule =
+    CASE TRUE
+        WHEN value=total  THEN 1 -- First
+        WHEN value%1000=0 THEN 2 -- 1000s
+        WHEN value%1000=1 THEN 3 -- 1001s
+        WHEN value%200=0  THEN 4 -- 200s
+        WHEN value%200=1  THEN 5 -- 201s
+        WHEN value%100=0  THEN 6 -- 100s
+        WHEN value%100=1  THEN 7 -- 101s
+        WHEN value%2=1    THEN 8 -- Odds
+        ELSE 9                   -- Evens
+    END
+FROM (
+    -- Countdowns only go down, so the first message has the highest value
+    SELECT countdownID, max(value) AS total
+    FROM messages
+    GROUP BY countdownID
+) AS totals
+WHERE messages.countdownID = totals.countdownID AND messages.rule IS NULL;
+
+ALTER TABLE messages ALTER COLUMN rule SET NOT NULL;
+
+-- Add lookup indexes
+CREATE INDEX IF NOT EXISTS countdownsServer ON countdowns(serverID);
+CREATE INDEX IF NOT EXISTS messagesCountdownValue ON messages(countdownID, value);
+
+COMMIT;